@@ -1,5 +1,6 @@
 from simulation.monte_carlo import simulate_monte_carlo
 from simulation.matrix_method import simulate_matrix_method
+from simulation.importance_sampling import simulate_importance_sampling
 
 def estimate_cut_point(pfa, word,n_trails = 10000, method = "monte_carlo", threshold = 0.5):
     """_summary_
@@ -8,7 +9,8 @@ def estimate_cut_point(pfa, word,n_trails = 10000, method = "monte_carlo", thres
         pfa: PFA instance_
         word (str): word to be analyzed
         n_traials (int): Number of trails for the monte carlo, Defaults to 10000.
-        method (str): Method being tested, either monte Carlo or Matrix method. Defaults to "monte_carlo".
+        method (str): Method being tested, either monte Carlo, Matrix method or importance sampling
+            (for rare words whose probability plain monte Carlo rounds to 0). Defaults to "monte_carlo".
         threshold (float): Cut point threshold in [0,1]. Defaults to 0.5.
 
     Raises:
@@ -24,8 +26,11 @@ def estimate_cut_point(pfa, word,n_trails = 10000, method = "monte_carlo", thres
     elif method == "matrix_method":
         result = simulate_matrix_method(pfa, word)
         prob = result["exact_probability"]
+    elif method == "importance_sampling":
+        result = simulate_importance_sampling(pfa, word, n_trial=n_trails)
+        prob = result["acceptance_probability"]
     else:
-        raise ValueError("Method must be either 'monte_carlo' or 'matrix_method'")
+        raise ValueError("Method must be either 'monte_carlo', 'matrix_method' or 'importance_sampling'")
     
     return {
         "word": word,
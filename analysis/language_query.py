@@ -0,0 +1,222 @@
+import time
+import numpy as np
+
+def regex_to_dfa(pattern, alphabet):
+    """
+    Compiles a regular expression over single-character symbols into a DFA
+    (Thompson NFA + subset construction). Supports literals, '.', '|', '*', '+', '?'
+    and parentheses; the whole word must match.
+
+    Args:
+        pattern (str): regular expression, e.g. "a(b|a)*b".
+        alphabet (list): symbols of the PFA.
+
+    Raises:
+        ValueError: if the pattern is malformed or uses a symbol outside the alphabet.
+
+    Returns:
+        dict: {"states", "start_state", "accept_states", "transitions"} with
+        transitions[(state, symbol)] = state, in the same layout as a PFA.
+    """
+    alphabet = sorted(alphabet)
+    # NFA edges: edges[i] = list of (symbol or None for epsilon, j)
+    edges = []
+
+    def new_state():
+        edges.append([])
+        return len(edges) - 1
+
+    pos = 0
+
+    def peek():
+        return pattern[pos] if pos < len(pattern) else None
+
+    def parse_alternation():
+        nonlocal pos
+        start, end = parse_concatenation()
+        while peek() == "|":
+            pos += 1
+            s2, e2 = parse_concatenation()
+            s, e = new_state(), new_state()
+            edges[s] += [(None, start), (None, s2)]
+            edges[end].append((None, e))
+            edges[e2].append((None, e))
+            start, end = s, e
+        return start, end
+
+    def parse_concatenation():
+        start = end = new_state()
+        while peek() is not None and peek() not in "|)":
+            s, e = parse_repetition()
+            edges[end].append((None, s))
+            end = e
+        return start, end
+
+    def parse_repetition():
+        nonlocal pos
+        start, end = parse_atom()
+        while peek() is not None and peek() in "*+?":
+            op = pattern[pos]
+            pos += 1
+            s, e = new_state(), new_state()
+            edges[s].append((None, start))
+            edges[end].append((None, e))
+            if op in "*?":
+                edges[s].append((None, e))
+            if op in "*+":
+                edges[end].append((None, start))
+            start, end = s, e
+        return start, end
+
+    def parse_atom():
+        nonlocal pos
+        char = peek()
+        if char is None or char in "|)*+?":
+            raise ValueError(f"Unexpected {char!r} at position {pos} in pattern {pattern!r}")
+        pos += 1
+        if char == "(":
+            start, end = parse_alternation()
+            if peek() != ")":
+                raise ValueError(f"Missing ')' in pattern {pattern!r}")
+            pos += 1
+            return start, end
+        symbols = alphabet if char == "." else [char]
+        if char != "." and char not in alphabet:
+            raise ValueError(f"Symbol {char} not in alphabet")
+        s, e = new_state(), new_state()
+        for symbol in symbols:
+            edges[s].append((symbol, e))
+        return s, e
+
+    nfa_start, nfa_accept = parse_alternation()
+    if pos != len(pattern):
+        raise ValueError(f"Unexpected {pattern[pos]!r} at position {pos} in pattern {pattern!r}")
+
+    def closure(states):
+        stack, seen = list(states), set(states)
+        while stack:
+            for symbol, j in edges[stack.pop()]:
+                if symbol is None and j not in seen:
+                    seen.add(j)
+                    stack.append(j)
+        return frozenset(seen)
+
+    start = closure([nfa_start])
+    names = {start: 0}
+    queue = [start]
+    transitions = {}
+    while queue:
+        current = queue.pop()
+        for symbol in alphabet:
+            target = closure([j for i in current for a, j in edges[i] if a == symbol])
+            if not target:
+                continue
+            if target not in names:
+                names[target] = len(names)
+                queue.append(target)
+            transitions[(names[current], symbol)] = names[target]
+
+    return {
+        "states": list(range(len(names))),
+        "start_state": 0,
+        "accept_states": [names[s] for s in names if nfa_accept in s],
+        "transitions": transitions
+    }
+
+
+def _product_parts(pfa, dfa):
+    """
+    Transition matrices of the PFA and 0/1 matrices of the DFA per symbol, plus the
+    initial (Q x D) mass and final (Q x D) mask of the product PFA x DFA.
+    """
+    if isinstance(dfa, str):
+        dfa = regex_to_dfa(dfa, pfa.alphabet)
+    mu = pfa.get_transition_matrices()
+    dfa_index = {state: i for i, state in enumerate(dfa["states"])}
+    D = len(dfa_index)
+
+    delta = {symbol: np.zeros((D, D)) for symbol in pfa.alphabet}
+    for (src, symbol), dst in dfa["transitions"].items():
+        if symbol not in delta:
+            raise ValueError(f"Symbol {symbol} not in alphabet")
+        delta[symbol][dfa_index[src], dfa_index[dst]] = 1.0
+
+    dfa_start = np.zeros((1, D))
+    dfa_start[0, dfa_index[dfa["start_state"]]] = 1.0
+    dfa_final = np.zeros((1, D))
+    for state in dfa["accept_states"]:
+        dfa_final[0, dfa_index[state]] = 1.0
+
+    initial = pfa.get_intial_vector().T @ dfa_start
+    final = pfa.get_final_vector() @ dfa_final
+    return mu, delta, initial, final
+
+
+def language_acceptance_probability(pfa, dfa, max_length, z=1.0):
+    """
+    Total acceptance probability of all words of the language of `dfa`, per length,
+    through the product PFA x DFA:
+
+    p_n = sum over matching words w with |w| = n of A(w)
+
+    The (Q x D) mass over product states is advanced with
+    X_n+1 = sum_a mu(a)^T * X_n * delta(a), one step per length, so the cost is
+    polynomial in max_length instead of |alphabet|^max_length words.
+
+    Args:
+        pfa: PFA instance.
+        dfa (str | dict): regular expression over pfa.alphabet, or a DFA as returned by regex_to_dfa.
+        max_length (int): longest word length considered.
+        z (float): weight of the length generating function sum_n z^n * p_n. Defaults to 1.0.
+
+    Returns:
+        dict: per-length probabilities, their total and the truncated generating function value.
+    """
+    mu, delta, current, final = _product_parts(pfa, dfa)
+
+    start_time = time.time()
+    length_probs = [float((current * final).sum())]
+    for _ in range(max_length):
+        current = sum(mu[symbol].T @ current @ delta[symbol] for symbol in pfa.alphabet)
+        length_probs.append(float((current * final).sum()))
+    end_time = time.time()
+
+    return {
+        "max_length": max_length,
+        "length_probabilities": length_probs,
+        "total_probability": float(sum(length_probs)),
+        "z": z,
+        "generating_function": float(sum(p * z ** n for n, p in enumerate(length_probs))),
+        "time_taken": end_time - start_time
+    }
+
+
+def language_generating_function(pfa, dfa, z):
+    """
+    Closed form of sum over all n >= 0 of z^n * p_n (every word of the language, any length):
+
+    G(z) = v_0 * (I - z * M)^-1 * f^T
+
+    where M = sum_a mu(a) (x) delta(a) is the transition matrix of the product PFA x DFA.
+
+    Raises:
+        ValueError: if z * spectral_radius(M) >= 1, since the series then diverges.
+    """
+    mu, delta, initial, final = _product_parts(pfa, dfa)
+
+    start_time = time.time()
+    M = sum(np.kron(mu[symbol], delta[symbol]) for symbol in pfa.alphabet)
+    radius = float(np.max(np.abs(np.linalg.eigvals(M)))) if M.size else 0.0
+    if abs(z) * radius >= 1:
+        raise ValueError(f"Generating function diverges: |z| * spectral radius = {abs(z) * radius}")
+    n = M.shape[0]
+    # Row-major flattening of (Q x D) matches the kron ordering (q, d).
+    value = initial.reshape(1, n) @ np.linalg.solve(np.eye(n) - z * M, final.reshape(n, 1))
+    end_time = time.time()
+
+    return {
+        "z": z,
+        "spectral_radius": radius,
+        "generating_function": float(value[0][0]),
+        "time_taken": end_time - start_time
+    }
@@ -1,19 +1,22 @@
 import numpy as np
 import time
+from simulation.matrix_method import resolve_precision
 
-def loop_acceptance_probability_matrix(pfa, symbol, k):
+def loop_acceptance_probability_matrix(pfa, symbol, k, dtype=np.float64, accumulate_dtype=None):
     """
     Exact acceptance probability of repeating `symbol` k times.
-    Uses matrix multiplication.
+    Uses matrix multiplication, `dtype`/`accumulate_dtype` as in simulate_matrix_method.
     """
-    v0 = pfa.get_intial_vector()
-    f = pfa.get_final_vector()
-    mu = pfa.get_transition_matrices()[symbol]
+    dtype, accumulate_dtype = resolve_precision(dtype, accumulate_dtype)
+    v0 = pfa.get_intial_vector(dtype=accumulate_dtype)
+    f = pfa.get_final_vector(dtype=accumulate_dtype)
+    mu = pfa.get_transition_matrices(dtype=dtype)[symbol].astype(accumulate_dtype)
 
     start = time.time()
-    prob = float(v0 @ np.linalg.matrix_power(mu, k) @ f)
+    prob = float((v0 @ np.linalg.matrix_power(mu, k) @ f)[0][0])
     return {
         "method": "matrix",
+        "dtype": dtype.name,
         "symbol": symbol,
         "k": k,
         "probability": prob,
@@ -21,6 +21,7 @@ class PFA:
         self.state_index = {state: i for i, state in enumerate(self.states)}
         self.allow_substochastic = allow_substochastic
         self._validate()
+        self._build_alias_tables()
         
         
     def _validate(self):
@@ -40,29 +41,91 @@ class PFA:
                     raise ValueError(f"Probabilities from ({state}, '{symbol}') are substochastic but not allowed.")
     
     
+    def _build_alias_tables(self):
+        """
+        Precomputes a Walker/Vose alias table for every (state, symbol) so that
+        sampling the next state is O(1) and allocation free.
+        The missing mass of a substochastic row is a halting outcome (None),
+        the same as an undefined transition, so sampling agrees with the matrix method.
+        self._alias[(state, symbol)] = (next_states, weights, accept, alias)
+        """
+        self._alias = {}
+        for key, outcomes in self.transitions.items():
+            next_states = list(outcomes.keys())
+            weights = list(outcomes.values())
+            total = sum(weights)
+            if total <= 0:
+                continue
+            if total < 1.0 - 1e-8:
+                next_states.append(None)
+                weights.append(1.0 - total)
+                total = 1.0
+            n = len(next_states)
+            scaled = [w * n / total for w in weights]
+            accept = [1.0] * n
+            alias = list(range(n))
+            small = [i for i, w in enumerate(scaled) if w < 1.0]
+            large = [i for i, w in enumerate(scaled) if w >= 1.0]
+            while small and large:
+                s, l = small.pop(), large.pop()
+                accept[s] = scaled[s]
+                alias[s] = l
+                scaled[l] -= 1.0 - scaled[s]
+                (small if scaled[l] < 1.0 else large).append(l)
+            self._alias[key] = (next_states, weights, accept, alias)
+
+    def _sample_next(self, table):
+        next_states, weights, accept, alias = table
+        u = random.random() * len(next_states)
+        i = int(u)
+        if u - i >= accept[i]:
+            i = alias[i]
+        return next_states[i], weights[i]
+
     def run_once(self, word):
         current = self.start_state
         prob = 1.0
         for symbol in word:
-            key = (current, symbol)
-            if key not in self.transitions:
+            table = self._alias.get((current, symbol))
+            if table is None:
                 return False, 0.0 # No transition defined
-            outcomes = self.transitions[key]
-            next_states = list(outcomes.keys())
-            weights = list(outcomes.values())
-            chosen = random.choices(next_states, weights=weights, k=1)[0]
-            prob *= outcomes[chosen]
-            current = chosen
+            current, p = self._sample_next(table)
+            if current is None:
+                return False, 0.0 # Halted on the missing substochastic mass
+            prob *= p
         return current in self.accept_states, prob
+
+    def sample_path(self, word):
+        """
+        Samples a single walk over `word` and keeps the visited states.
+        Returns:
+            tuple: (path, accepted, prob) where path starts at start_state and
+            stops early if the walk halts (then accepted is False and prob 0.0).
+        """
+        current = self.start_state
+        path = [current]
+        prob = 1.0
+        for symbol in word:
+            table = self._alias.get((current, symbol))
+            if table is None:
+                return path, False, 0.0
+            current, p = self._sample_next(table)
+            if current is None:
+                return path, False, 0.0
+            prob *= p
+            path.append(current)
+        return path, current in self.accept_states, prob
     
-    def get_transition_matrices(self):
+    def get_transition_matrices(self, dtype=np.float64):
         """_summary_
         Creates a matrix for each symbol in the alphabet, where the entry (i, j)
+        Args:
+            dtype: numpy dtype used to store the matrices. Defaults to float64.
         Returns:
             matrix: dim(Q x Q)
         """
         Q = len(self.states)
-        matrices = {symbol: np.zeros((Q, Q)) for symbol in self.alphabet}
+        matrices = {symbol: np.zeros((Q, Q), dtype=dtype) for symbol in self.alphabet}
         
         for (src, sym), outcomes in self.transitions.items():
             i = self.state_index[src]
@@ -71,13 +134,13 @@ class PFA:
                 matrices[sym][i,j] = prob
         return matrices
     
-    def get_intial_vector(self):
-        v = np.zeros((1, len(self.states)))
+    def get_intial_vector(self, dtype=np.float64):
+        v = np.zeros((1, len(self.states)), dtype=dtype)
         v[0, self.state_index[self.start_state]] = 1.0
         return v
     
-    def get_final_vector(self):
-        v = np.zeros((len(self.states), 1))
+    def get_final_vector(self, dtype=np.float64):
+        v = np.zeros((len(self.states), 1), dtype=dtype)
         for state in self.accept_states:
             v[self.state_index[state], 0] = 1.0
         return v       
\ No newline at end of file
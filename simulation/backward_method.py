@@ -0,0 +1,112 @@
+import time
+import numpy as np
+from core.pfa import PFA
+
+def suffix_vector(pfa: PFA, suffix: str, cache: dict = None, mu: dict = None) -> np.ndarray:
+    """
+    Backward vector mu(s1) * ... * mu(sm) * f^T of a suffix, as a (Q x 1) column.
+    Entry i is the probability of accepting the suffix when starting in state i.
+
+    cache (dict): suffix -> vector, shared between calls on the same PFA. Every tail
+        of the suffix is stored too, so suffixes sharing an ending reuse its products.
+    mu (dict): transition matrices from pfa.get_transition_matrices(), built here if
+        not given; pass them in when calling repeatedly.
+
+    Returns:
+        np.ndarray: a copy, so changing it does not touch the cache.
+    """
+    if cache is None:
+        cache = {}
+    if "" not in cache:
+        cache[""] = pfa.get_final_vector()
+
+    # Longest tail already cached, then extend it leftwards one symbol at a time.
+    k = 0
+    while suffix[k:] not in cache:
+        k += 1
+    current = cache[suffix[k:]]
+    if mu is None and k > 0:
+        mu = pfa.get_transition_matrices()
+    for i in range(k - 1, -1, -1):
+        symbol = suffix[i]
+        if symbol not in mu:
+            raise ValueError(f"Symbol {symbol} not in alphabet")
+        current = mu[symbol] @ current
+        cache[suffix[i:]] = current
+    return current.copy()
+
+
+def prefix_distributions(pfa: PFA, prefixes, cache: dict = None, mu: dict = None) -> np.ndarray:
+    """
+    Forward state distributions v_0 * mu(p1) * ... * mu(pk), one row per prefix (P x Q).
+
+    cache (dict): prefix -> (1 x Q) row, shared between calls on the same PFA.
+        Prefixes sharing a beginning reuse its products.
+    mu (dict): transition matrices from pfa.get_transition_matrices(), built here if not given.
+    """
+    if cache is None:
+        cache = {}
+    if "" not in cache:
+        cache[""] = pfa.get_intial_vector()
+    if mu is None:
+        mu = pfa.get_transition_matrices()
+
+    rows = []
+    for prefix in prefixes:
+        k = len(prefix)
+        while prefix[:k] not in cache:
+            k -= 1
+        current = cache[prefix[:k]]
+        for i in range(k, len(prefix)):
+            symbol = prefix[i]
+            if symbol not in mu:
+                raise ValueError(f"Symbol {symbol} not in alphabet")
+            current = current @ mu[symbol]
+            cache[prefix[:i + 1]] = current
+        rows.append(current)
+    if not rows:
+        return np.zeros((0, len(pfa.states)))
+    return np.vstack(rows)
+
+
+def simulate_prefix_suffix_table(pfa: PFA, prefixes, suffixes, prefix_cache: dict = None,
+                                 suffix_cache: dict = None) -> dict:
+    """
+    Acceptance probabilities of every concatenation prefix + suffix:
+
+    A(p s) = [v_0 * mu(p)] * [mu(s) * f^T]
+
+    The forward rows (P x Q) and backward columns (Q x S) are built once with shared
+    products and combined with a single matrix product, instead of P * S full words.
+
+    pfa (PFA): instance of PFA class.
+    prefixes (list[str]): words scored on the left.
+    suffixes (list[str]): fixed set of endings.
+    prefix_cache, suffix_cache (dict): optional caches reused across calls on the same PFA.
+
+    Returns:
+        dict: "table" (P x S) array with table[i, j] = A(prefixes[i] + suffixes[j]),
+        "suffix_vectors" (Q x S) array whose rows are the same probabilities per start state,
+        and time taken.
+    """
+    prefixes, suffixes = list(prefixes), list(suffixes)
+    start_time = time.time()
+
+    mu = pfa.get_transition_matrices()
+    forward = prefix_distributions(pfa, prefixes, cache=prefix_cache, mu=mu)
+    if suffix_cache is None:
+        suffix_cache = {}
+    if suffixes:
+        backward = np.hstack([suffix_vector(pfa, s, cache=suffix_cache, mu=mu) for s in suffixes])
+    else:
+        backward = np.zeros((len(pfa.states), 0))
+    table = forward @ backward
+    end_time = time.time()
+
+    return {
+        "prefixes": prefixes,
+        "suffixes": suffixes,
+        "table": table,
+        "suffix_vectors": backward,
+        "time_taken": end_time - start_time
+    }
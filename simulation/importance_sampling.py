@@ -0,0 +1,76 @@
+import time
+import numpy as np
+from core.pfa import PFA
+
+def simulate_importance_sampling(pfa: PFA, word: str, n_trial: int = 1000, seed: int = None) -> dict:
+    """
+    Rare-event estimate of the acceptance probability of a word by importance sampling.
+
+    The backward reachability vectors r_t (r_n = support of f, r_t[i] = 1 if some
+    transition on a_t+1 leads to a state with r_t+1 = 1) mark, for every step, the
+    states from which acceptance of the remaining suffix is still possible. Runs are
+    drawn from the proposal
+
+    q_t(i -> j) proportional to mu(a_t+1)[i, j] * r_t+1[j]
+
+    so no run is wasted in a dead state, and each run is weighted by the likelihood
+    ratio prod mu / q (the mass mu kept on reachable states at every step). The mean
+    weight is an unbiased estimate of A(w); only 0/1 supports are propagated, so the
+    exact probability is never computed ahead of sampling.
+
+    pfa (PFA): instance of PFA class.
+    word (str): The input string to process.
+    n_trial (int): The number of weighted runs, at least 1.
+    seed (int): Random seed for reproducibility.
+    """
+    if n_trial < 1:
+        raise ValueError(f"n_trial must be at least 1, got {n_trial}")
+    mu = pfa.get_transition_matrices()
+    f = pfa.get_final_vector()[:, 0]
+    for symbol in word:
+        if symbol not in mu:
+            raise ValueError(f"Symbol {symbol} not in alphabet")
+    rng = np.random.default_rng(seed)
+    start = pfa.state_index[pfa.start_state]
+
+    start_time = time.time()
+
+    reachable = [f > 0]
+    for symbol in reversed(word):
+        reachable.append((mu[symbol] > 0) @ reachable[-1])
+    reachable.reverse()
+
+    states = np.full(n_trial, start)
+    weights = np.ones(n_trial)
+    if reachable[0][start]:
+        for t, symbol in enumerate(word):
+            proposal = mu[symbol] * reachable[t + 1]
+            kept = proposal.sum(axis=1)
+            cdf = np.cumsum(proposal, axis=1)
+            # Sample per distinct current state so temporaries stay O(n_trial).
+            order = np.argsort(states, kind="stable")
+            current, first = np.unique(states[order], return_index=True)
+            nxt = np.empty_like(states)
+            for s, lo, hi in zip(current, first, np.append(first[1:], n_trial)):
+                idx = order[lo:hi]
+                u = rng.random(hi - lo) * kept[s]
+                nxt[idx] = np.minimum(np.searchsorted(cdf[s], u, side="right"), len(pfa.states) - 1)
+            weights *= kept[states]
+            states = nxt
+    else:
+        weights[:] = 0.0
+    end_time = time.time()
+
+    estimate = float(weights.mean())
+    stderr = float(weights.std(ddof=1) / np.sqrt(n_trial)) if n_trial > 1 else 0.0
+    ess = float(weights.sum() ** 2 / (weights ** 2).sum()) if estimate > 0 else 0.0
+
+    return {
+        "word": word,
+        "n_trial": n_trial,
+        "acceptance_probability": estimate,
+        "stderr": stderr,
+        "relative_error": stderr / estimate if estimate > 0 else 0.0,
+        "effective_sample_size": ess,
+        "time_taken": end_time - start_time
+    }
@@ -2,36 +2,87 @@ import time
 import numpy as np
 from core.pfa import PFA
 
-def simulate_matrix_method(pfa: PFA, word: str) -> dict:
+
+def resolve_precision(dtype=np.float64, accumulate_dtype=None):
+    """
+    Returns the (storage, accumulation) dtype pair used by the matrix engines.
+    float16 storage is always accumulated in float32, since half precision
+    products lose too many digits after a handful of symbols.
+
+    dtype: dtype used to store the transition matrices and vectors.
+    accumulate_dtype: dtype used for the products, defaults to the storage dtype.
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind != "f":
+        raise ValueError(f"dtype must be a floating point type, got {dtype}")
+    if accumulate_dtype is None:
+        accumulate_dtype = np.float32 if dtype == np.float16 else dtype
+    accumulate_dtype = np.dtype(accumulate_dtype)
+    if accumulate_dtype.kind != "f" or accumulate_dtype.itemsize < dtype.itemsize:
+        raise ValueError(f"accumulate_dtype {accumulate_dtype} cannot be narrower than dtype {dtype}")
+    return dtype, accumulate_dtype
+
+
+def precision_error_bound(n_symbols, n_states, dtype=np.float64, accumulate_dtype=None):
+    """
+    A priori bound on |A_low(w) - A_64(w)| for a word of n_symbols symbols.
+
+    Every entry of v_0, mu(a) and f is in [0,1] and every partial product stays
+    a (sub)probability vector, so the absolute error is bounded by the relative
+    one: storing each matrix costs one rounding in `dtype` per symbol, and each
+    vector-matrix product costs at most n_states roundings in `accumulate_dtype`.
+    """
+    dtype, accumulate_dtype = resolve_precision(dtype, accumulate_dtype)
+    u_store = np.finfo(dtype).eps / 2
+    u_acc = np.finfo(accumulate_dtype).eps / 2
+    k = (n_symbols + 1) * (n_states + 1) * u_acc + n_symbols * u_store
+    if k >= 1:
+        return 1.0
+    return float(k / (1 - k))
+
+
+def simulate_matrix_method(pfa: PFA, word: str, dtype=np.float64, accumulate_dtype=None,
+                           check_error=False) -> dict:
     """
     Computes the acceptance probability of a word using the matrix method:
-    
+
     A(w) = v_0 * mu(a1) * mu(a2) * ... * mu(an) * f^T
-    
+
     where v_0 is the initial state vector, mu(a) is the transition matrix for symbol a,
 
-    
+
     pfa (PFA): instance of PFA class.
     word (str): the word being tested.
+    dtype: storage dtype of the matrices (float64, float32 or float16). Defaults to float64.
+        float32 is the throughput option; float16 is only a storage/precision experiment,
+        its matrices are widened to float32 for the products and it is not faster than float32.
+    accumulate_dtype: dtype of the products, float16 storage accumulates in float32 by default.
+    check_error (bool): if True, also runs the float64 reference and reports the
+        observed error against `precision_error_bound`.
 
     Returns:
         dict: Dictionary with exact probabilities and time taken.
     """
-    
-    mu = pfa.get_transition_matrices()
-    v0 = pfa.get_intial_vector()
-    f = pfa.get_final_vector()
-    
+
+    dtype, accumulate_dtype = resolve_precision(dtype, accumulate_dtype)
+    mu = pfa.get_transition_matrices(dtype=dtype)
+    v0 = pfa.get_intial_vector(dtype=accumulate_dtype)
+    f = pfa.get_final_vector(dtype=accumulate_dtype)
+
     start_time = time.time()
-    
-    
+
+
     try:
         current = v0
+        # Each symbol's matrix is cast to the accumulation dtype once per call, not per step.
+        compute = {}
         for symbol in word:
             if symbol not in mu:
                 raise ValueError(f"Symbol {symbol} not in alphabet")
-            current = np.dot(current, mu[symbol])
-        
+            if symbol not in compute:
+                compute[symbol] = mu[symbol].astype(accumulate_dtype, copy=False)
+            current = current @ compute[symbol]
+
         result = float(np.dot(current, f)[0][0])
     except Exception as e:
         return {
@@ -41,9 +92,18 @@ def simulate_matrix_method(pfa: PFA, word: str) -> dict:
             "time_taken": time.time() - start_time
         }
     end_time = time.time()
-    
-    return {
+
+    output = {
         "word": word,
         "exact_probability": result,
+        "dtype": dtype.name,
         "time_taken": end_time - start_time
-    }   
\ No newline at end of file
+    }
+    if check_error:
+        reference = simulate_matrix_method(pfa, word)["exact_probability"]
+        bound = precision_error_bound(len(word), len(pfa.states), dtype, accumulate_dtype)
+        output["reference_probability"] = reference
+        output["absolute_error"] = abs(result - reference)
+        output["error_bound"] = bound
+        output["within_bound"] = output["absolute_error"] <= bound
+    return output
@@ -16,19 +16,22 @@ def simulate_monte_carlo(pfa: PFA, word: str, n_trial: int = 1000, seed: int = N
         
     
     accept_count = 0
-    probabilities = []
+    # Welford accumulators for the path probability, constant memory in n_trial.
+    avg_path_prob = 0.0
+    m2_path_prob = 0.0
     
     start_time = time.time()
-    for _ in range(n_trial):
+    for trial in range(1, n_trial + 1):
         accepted, prob = pfa.run_once(word)
         if accepted:
             accept_count += 1
-        probabilities.append(prob)
+        delta = prob - avg_path_prob
+        avg_path_prob += delta / trial
+        m2_path_prob += delta * (prob - avg_path_prob)
     end_time = time.time()
     
     acceptance_prob = accept_count / n_trial
-    avg_path_prob = np.mean(probabilities)
-    std_path_prob = np.std(probabilities)
+    std_path_prob = np.sqrt(m2_path_prob / n_trial)
     
     return {
         "word": word,
@@ -0,0 +1,58 @@
+import time
+import numpy as np
+from core.pfa import PFA
+
+def simulate_path_moments(pfa: PFA, word: str) -> dict:
+    """
+    Exact moments of the path probability P of a single run of `word`, the
+    quantity simulate_monte_carlo samples once per trial (P = 0 if the run halts).
+
+    A run follows path q_0 ... q_n with probability P itself, so
+    E[P^k] = v_0 * mu(a1)^(k+1) * ... * mu(an)^(k+1) * 1
+    where mu(a)^(k+1) is the elementwise power. Replacing 1 by f restricts the
+    sum to accepting runs. The three vectors are advanced in one forward pass.
+
+    pfa (PFA): instance of PFA class.
+    word (str): the word being tested.
+
+    Returns:
+        dict: acceptance probability and mean/stddev of the path probability,
+        over all runs and conditioned on acceptance.
+    """
+    mu = pfa.get_transition_matrices()
+    v0 = pfa.get_intial_vector()
+    f = pfa.get_final_vector()
+    ones = np.ones_like(f)
+
+    start_time = time.time()
+    for symbol in word:
+        if symbol not in mu:
+            raise ValueError(f"Symbol {symbol} not in alphabet")
+
+    # Row k holds v_0 * prod mu^(k+1) for k = 0, 1, 2.
+    current = np.repeat(v0, 3, axis=0)
+    powers = {}
+    for symbol in word:
+        if symbol not in powers:
+            powers[symbol] = np.stack([mu[symbol] ** k for k in (1, 2, 3)])
+        current = np.einsum("ki,kij->kj", current, powers[symbol])
+
+    acceptance_prob, m1_acc, m2_acc = (current @ f)[:, 0]
+    _, m1, m2 = (current @ ones)[:, 0]
+    end_time = time.time()
+
+    if acceptance_prob > 0:
+        avg_acc = m1_acc / acceptance_prob
+        std_acc = np.sqrt(max(m2_acc / acceptance_prob - avg_acc ** 2, 0.0))
+    else:
+        avg_acc = std_acc = 0.0
+
+    return {
+        "word": word,
+        "acceptance_probability": float(acceptance_prob),
+        "average_path_probability": float(m1),
+        "stddev_path_probability": float(np.sqrt(max(m2 - m1 ** 2, 0.0))),
+        "average_path_probability_accepted": float(avg_acc),
+        "stddev_path_probability_accepted": float(std_acc),
+        "time_taken": end_time - start_time
+    }
@@ -1,6 +1,7 @@
 import pandas as pd
 from simulation.monte_carlo import simulate_monte_carlo
 from simulation.matrix_method import simulate_matrix_method
+from simulation.path_moments import simulate_path_moments
 
 def benchmark_pfa(pfa, words, n_trial=1000):
     """_summary_
@@ -33,13 +34,14 @@ def benchmark_pfa(pfa, words, n_trial=1000):
     #--- Matrix Method ---
     
     mm_result = simulate_matrix_method(pfa, word)
+    pm_result = simulate_path_moments(pfa, word) if "error" not in mm_result else {}
     
     mm_row = {
         "Word": mm_result.get("word", word),
         "Method": "Matrix Product",
         "Probability": mm_result.get("exact_probability", 0.0),
-        "Average Path Prob": None,
-        "Stddev Path Prob": None,
+        "Average Path Prob": pm_result.get("average_path_probability"),
+        "Stddev Path Prob": pm_result.get("stddev_path_probability"),
         "Elapsed Time (s)": mm_result.get("time_taken", None),
         "Trials": None,
     }